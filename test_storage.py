@@ -1,6 +1,5 @@
 
 import socket
-import struct
 import json
 import time
 
@@ -15,6 +14,15 @@ def send_nl_command(command):
         response = s.recv(4096).decode('utf-8')
         return response
 
+def wait_until_found(concept_id, timeout=1.0, interval=0.05):
+    """Query a concept by ID until the server reports it found or timeout expires"""
+    deadline = time.monotonic() + timeout
+    resp = send_nl_command(f"Search for {concept_id}")
+    while '"found": true' not in resp and time.monotonic() < deadline:
+        time.sleep(interval)
+        resp = send_nl_command(f"Search for {concept_id}")
+    return resp
+
 def test_nl_interface():
     print("\n--- Testing NL Interface ---")
     
@@ -23,14 +31,14 @@ def test_nl_interface():
     resp = send_nl_command("Remember that Sutra is fast")
     print(f"Response: {resp.strip()}")
     assert "LearnConceptV2Ok" in resp, "Failed to learn"
+    concept_id = json.loads(resp)["LearnConceptV2Ok"]["concept_id"]
 
     # Test 2: Query
-    print("Test 2: Search for 'Sutra'")
-    time.sleep(1) # wait for indexing (though it's fast)
-    resp = send_nl_command("Search for Sutra")
+    print(f"Test 2: Search for {concept_id}")
+    resp = wait_until_found(concept_id)
     print(f"Response: {resp.strip()}")
-    # Note: might fail if embedding dim mismatch, but checking response format
     assert "QueryConceptOk" in resp, "Failed to query"
+    assert '"found": true' in resp, "Learned concept not found"
 
     # Test 3: List
     print("Test 3: List memory")